@@ -22,6 +22,15 @@ from readmeai.models.factory import ModelFactory
 from readmeai.postprocessor import markdown_to_html, response_cleaner
 from readmeai.retrievers.git.repository import load_data
 from readmeai.utilities.file_handler import FileHandler
+from readmeai.utilities.importer import is_available
+
+if is_available("uvloop"):
+    import uvloop
+
+    UVLOOP_AVAILABLE = True
+else:
+    uvloop = None
+    UVLOOP_AVAILABLE = False
 
 _logger = get_logger(__name__)
 
@@ -38,6 +47,8 @@ def error_handler() -> Generator[None, None, None]:
 def readme_agent(config: ConfigLoader, output_file: str) -> None:
     """Wrap asyncronous README generation process with context manager."""
     with error_handler():
+        if UVLOOP_AVAILABLE:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
         asyncio.run(readme_generator(config, output_file))
 
 
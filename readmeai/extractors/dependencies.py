@@ -6,7 +6,7 @@ from readmeai.core.logger import get_logger
 from readmeai.extractors.models import FileContext
 from readmeai.parsers.factory import ParserFactory
 from readmeai.preprocessor.document_cleaner import DocumentCleaner
-from readmeai.preprocessor.file_filter import is_excluded
+from readmeai.preprocessor.file_filter import compile_ignore_list, is_excluded
 
 _logger = get_logger(__name__)
 
@@ -19,7 +19,9 @@ class FileProcessor:
     def __init__(self, config: ConfigLoader):
         self.config = config
         self.document_cleaner = DocumentCleaner()
-        self.ignore_list = config.ignore_list.get("ignore_list", [])
+        self.ignore_list = compile_ignore_list(
+            config.ignore_list.get("ignore_list", {})
+        )
         self.language_names = config.language_map.get("languages", {})
 
     def process_files(self, repo_path: Path) -> list[FileContext]:
@@ -43,16 +43,19 @@ class AnthropicHandler(BaseModelHandler):
     def _model_settings(self):
         self.client = anthropic.AsyncAnthropic()
         self.model = AnthropicModels.CLAUDE35_SONNET.value
+        self._base_payload = {
+            "model": self.model,
+            "temperature": self.temperature,
+            "system": self.system_message,
+        }
 
     async def _build_payload(self, prompt: str) -> dict[str, Any]:
         """Build request body for making text generation requests."""
 
         return {
-            "model": self.model,
+            **self._base_payload,
             "max_tokens": self.max_tokens,
-            "temperature": self.temperature,
             "messages": [{"role": "user", "content": prompt}],
-            "system": self.system_message,
         }
 
     @retry(
@@ -89,7 +92,9 @@ class AnthropicHandler(BaseModelHandler):
                     if hasattr(response, "content")
                     else str(response)
                 )
-                self._logger.info(f"Response from Anthropic for '{index}': {content}")
+                self._logger.debug(
+                    f"Response from Anthropic for '{index}': {content[:256]}"
+                )
                 return index, content
 
         except (
@@ -10,6 +10,7 @@ import aiohttp
 from readmeai.config.settings import ConfigLoader
 from readmeai.core.logger import get_logger
 from readmeai.extractors.models import RepositoryContext
+from readmeai.models.cache import get_cache
 from readmeai.models.enums import LLMProviders
 from readmeai.models.prompts import (
     get_prompt_context,
@@ -20,6 +21,22 @@ from readmeai.models.tokens import update_max_tokens
 
 _logger = get_logger(__name__)
 
+# Connection pool sized for single-host fan-out: keep every pooled
+# connection warm (keepalive >= typical server idle timeout) so batched
+# requests reuse TLS sessions instead of renegotiating per request.
+_CONNECTOR_LIMIT = 100
+_KEEPALIVE_EXPIRY = 30.0
+_DNS_CACHE_TTL = 300
+
+# Fail fast on connect/pool acquisition; allow slow LLM generations to
+# stream back without tripping the read timeout.
+_CLIENT_TIMEOUT = aiohttp.ClientTimeout(
+    total=None,
+    connect=5.0,
+    sock_connect=5.0,
+    sock_read=60.0,
+)
+
 
 class BaseModelHandler(ABC):
     """
@@ -40,6 +57,8 @@ class BaseModelHandler(ABC):
         self.top_p = self.config.llm.top_p
         self.repo_context = context
         self.dependencies = context.dependencies
+        self.cache = get_cache()
+        self.cache_scope = f"{self.config.llm.api}:{self.config.llm.model}"
         self.documents = [
             (file.path, file.content)
             for file in context.files
@@ -50,7 +69,14 @@ class BaseModelHandler(ABC):
     async def use_api(self) -> AsyncGenerator[Any, None]:
         """Async context manager for managing HTTP client lifecycle."""
         async with aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=None),
+            connector=aiohttp.TCPConnector(
+                limit=_CONNECTOR_LIMIT,
+                limit_per_host=_CONNECTOR_LIMIT,
+                keepalive_timeout=_KEEPALIVE_EXPIRY,
+                ttl_dns_cache=_DNS_CACHE_TTL,
+                enable_cleanup_closed=True,
+            ),
+            timeout=_CLIENT_TIMEOUT,
         ) as session:
             self._session = session
             try:
@@ -123,15 +149,24 @@ class BaseModelHandler(ABC):
         prompts: Any,
         batch_size: int = 10,
     ) -> list[tuple[str, str]]:
-        """Processes a batch of prompts and returns the generated text."""
-        responses = []
+        """Processes prompts concurrently, bounded by a semaphore."""
+        if len(prompts) == 1:
+            return [await self._process_batch(prompts[0])]
 
-        for batch in self._generate_batches(prompts, batch_size):
-            batch_responses = await asyncio.gather(
-                *[self._process_batch(prompt) for prompt in batch],
-                return_exceptions=False,
-            )
-            responses.extend(batch_responses)
+        semaphore = asyncio.Semaphore(batch_size)
+
+        async def process_bounded(index: int, prompt: dict[str, Any]) -> tuple:
+            async with semaphore:
+                return index, await self._process_batch(prompt)
+
+        tasks = [
+            asyncio.create_task(process_bounded(index, prompt))
+            for index, prompt in enumerate(prompts)
+        ]
+        responses: list[Any] = [None] * len(tasks)
+        for task in asyncio.as_completed(tasks):
+            index, response = await task
+            responses[index] = response
 
         return responses
 
@@ -160,12 +195,17 @@ class BaseModelHandler(ABC):
                 self.config.llm.tokens,
                 formatted_prompt,
             )
+            cached_summary = self.cache.get(formatted_prompt, self.cache_scope)
+            if cached_summary is not None:
+                return cached_summary
             _, summary = await self._make_request(
                 prompt["type"],
                 formatted_prompt,
                 tokens,
                 None,
             )
+            if summary != self.placeholder:
+                self.cache.set(formatted_prompt, summary, self.cache_scope)
             return summary
 
     async def _make_request_code_summary(
@@ -181,20 +221,106 @@ class BaseModelHandler(ABC):
                 repo_files=file_context["repo_files"],
             )
         else:
-            file_summaries = []
-            for file_path, file_content in file_context["repo_files"]:
-                prompt = self.prompts["prompts"]["file_summary"].format(
-                    self.config.md.directory_structure,
-                    file_path,
-                    file_content,
-                )
-                tokens = update_max_tokens(self.config.llm.tokens, prompt)
-                _, summary_or_error = await self._make_request(
-                    file_path,
-                    prompt,
-                    tokens,
-                    None,
-                )
-                file_summaries.append((file_path, summary_or_error))
+            semaphore = asyncio.Semaphore(self.rate_limit)
+            summary_template = self.prompts["prompts"]["file_summary"]
+            directory_structure = self.config.md.directory_structure
+            # ~4 chars per token: trim clearly-oversized file contents before
+            # the prompt is built, rather than formatting a huge prompt string
+            # only for the token handler to truncate it again.
+            max_content_chars = self.config.llm.context_window * 4
+
+            # The template is static per run, so split it around its
+            # positional fields once and build each prompt by concatenation;
+            # str.format would re-parse the template for every file, and
+            # concatenation is also safe when file contents contain braces.
+            # The fields must appear in ascending order for the chained
+            # partitions below to splice contents into the right positions.
+            has_ordered_fields = all(
+                field in summary_template for field in ("{0}", "{1}", "{2}")
+            ) and (
+                summary_template.index("{0}")
+                < summary_template.index("{1}")
+                < summary_template.index("{2}")
+            )
+            if has_ordered_fields:
+                prefix, _, rest = summary_template.partition("{0}")
+                middle, _, rest = rest.partition("{1}")
+                body, _, suffix = rest.partition("{2}")
+
+                def build_prompt(file_path: str, file_content: str) -> str:
+                    return (
+                        prefix
+                        + directory_structure
+                        + middle
+                        + file_path
+                        + body
+                        + file_content
+                        + suffix
+                    )
+
+            else:
+
+                def build_prompt(file_path: str, file_content: str) -> str:
+                    return summary_template.format(
+                        directory_structure, file_path, file_content
+                    )
+
+            async def summarize_group(
+                members: list[tuple[int, str]], prompt: str, tokens: int
+            ) -> tuple:
+                async with semaphore:
+                    _, summary_or_error = await self._make_request(
+                        members[0][1],
+                        prompt,
+                        tokens,
+                        None,
+                    )
+                if summary_or_error != self.placeholder:
+                    self.cache.set(prompt, summary_or_error, self.cache_scope)
+                return members, summary_or_error
+
+            repo_files = file_context["repo_files"]
+            file_summaries: list[tuple[str, str] | None] = [None] * len(repo_files)
+
+            # The chat completions endpoint takes one conversation per call,
+            # so files with identical contents (empty __init__.py modules,
+            # license stubs, vendored duplicates) are coalesced into a single
+            # request and the resulting summary is shared between them.
+            content_groups: dict[str, list[tuple[int, str]]] = {}
+            for index, (file_path, file_content) in enumerate(repo_files):
+                content_groups.setdefault(file_content, []).append((index, file_path))
+
+            def record(members: list[tuple[int, str]], summary: str) -> None:
+                for index, file_path in members:
+                    file_summaries[index] = (file_path, summary)
+
+            # Build prompts one window at a time so only a concurrency-cap's
+            # worth of formatted prompt strings (each embedding a file's
+            # contents) is alive at once, instead of one per file.
+            group_items = list(content_groups.items())
+            for window in self._generate_batches(group_items, self.rate_limit):
+                pending = []
+                for file_content, members in window:
+                    if len(file_content) > max_content_chars:
+                        file_content = file_content[:max_content_chars]
+                    # Name every coalesced file in the prompt so the shared
+                    # summary is not written against a single member's path.
+                    member_paths = ", ".join(path for _, path in members)
+                    prompt = build_prompt(member_paths, file_content)
+                    cached_summary = self.cache.get(prompt, self.cache_scope)
+                    if cached_summary is not None:
+                        record(members, cached_summary)
+                        continue
+                    tokens = update_max_tokens(self.config.llm.tokens, prompt)
+                    pending.append(summarize_group(members, prompt, tokens))
+
+                if len(pending) == 1:
+                    members, summary_or_error = await pending[0]
+                    record(members, summary_or_error)
+                elif pending:
+                    tasks = [asyncio.create_task(coro) for coro in pending]
+                    for task in asyncio.as_completed(tasks):
+                        members, summary_or_error = await task
+                        record(members, summary_or_error)
 
             return file_summaries
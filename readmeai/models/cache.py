@@ -0,0 +1,211 @@
+"""In-memory and on-disk TTL caching for LLM API responses."""
+
+import hashlib
+import os
+import threading
+import time
+
+from readmeai.utilities.importer import is_available
+
+if is_available("diskcache"):
+    import diskcache
+
+    DISKCACHE_AVAILABLE = True
+else:
+    diskcache = None
+    DISKCACHE_AVAILABLE = False
+
+_MAX_SIZE = 500
+_SHARD_COUNT = 8
+_TTL_SECONDS = 600.0
+
+_DISK_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "readmeai")
+_DISK_CACHE_SIZE = 2**30
+_DISK_TTL_SECONDS = 7 * 86400
+
+_SKETCH_WIDTH = 256
+_SKETCH_DEPTH = 4
+_SKETCH_MAX_COUNT = 15
+
+
+class _FrequencySketch:
+    """
+    Count-min sketch tracking approximate access frequency per cache key.
+
+    Counters are 4-bit saturating and periodically halved so the sketch
+    reflects recent popularity rather than all-time counts.
+    """
+
+    def __init__(self, decay_interval: int = 10 * _MAX_SIZE) -> None:
+        self._rows = [[0] * _SKETCH_WIDTH for _ in range(_SKETCH_DEPTH)]
+        self._decay_interval = decay_interval
+        self._increments = 0
+
+    @staticmethod
+    def _bucket(key: bytes, row_index: int) -> int:
+        """Map a digest key to a counter bucket for the given row."""
+        offset = row_index * 2
+        return int.from_bytes(key[offset : offset + 2], "little") % _SKETCH_WIDTH
+
+    def increment(self, key: bytes) -> None:
+        """Record one access to a key, decaying counters periodically."""
+        for row_index, row in enumerate(self._rows):
+            bucket = self._bucket(key, row_index)
+            if row[bucket] < _SKETCH_MAX_COUNT:
+                row[bucket] += 1
+        self._increments += 1
+        if self._increments >= self._decay_interval:
+            self._decay()
+
+    def estimate(self, key: bytes) -> int:
+        """Return the approximate access count for a key."""
+        return min(
+            row[self._bucket(key, row_index)]
+            for row_index, row in enumerate(self._rows)
+        )
+
+    def _decay(self) -> None:
+        """Halve all counters so stale popularity ages out."""
+        for row in self._rows:
+            for bucket in range(_SKETCH_WIDTH):
+                row[bucket] >>= 1
+        self._increments = 0
+
+
+class ResponseCache:
+    """
+    Sharded, TTL-bounded cache mapping prompts to generated text.
+
+    Prompts are keyed by a fixed-size digest rather than the full prompt
+    string, so lookups hash and compare 16 bytes instead of multi-KB
+    prompts and the cache never retains prompt text. Entries are spread
+    across shards selected by digest, each guarded by its own lock, so
+    concurrent writers contend on a single shard instead of the whole
+    cache; reads are lock-free. Entries expire after `ttl` seconds.
+
+    Insertion beyond `max_size` evicts expired entries first; if the cache
+    is still full, a TinyLFU-style admission check compares the new key's
+    sketched access frequency against the eviction victim's, so one-hit
+    prompts cannot displace entries that are still being reused.
+
+    With `persist` enabled and the optional diskcache package installed,
+    entries are additionally written to a content-addressed cache under
+    ~/.cache/readmeai, so repeat runs against an unchanged repository skip
+    the API entirely. The `scope` argument namespaces keys by provider and
+    model so responses from different backends never collide.
+    """
+
+    def __init__(
+        self,
+        max_size: int = _MAX_SIZE,
+        ttl: float = _TTL_SECONDS,
+        shard_count: int = _SHARD_COUNT,
+        persist: bool = False,
+    ) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self._shards: list[dict[bytes, tuple[float, str]]] = [
+            {} for _ in range(shard_count)
+        ]
+        self._locks = [threading.Lock() for _ in range(shard_count)]
+        self._sketch = _FrequencySketch(decay_interval=10 * max_size)
+        self._disk = (
+            diskcache.Cache(_DISK_CACHE_DIR, size_limit=_DISK_CACHE_SIZE)
+            if persist and DISKCACHE_AVAILABLE
+            else None
+        )
+
+    @staticmethod
+    def _key(prompt: str, scope: str = "") -> bytes:
+        """Derive a fixed-size digest key from a scoped prompt string."""
+        return hashlib.blake2b(f"{scope}|{prompt}".encode(), digest_size=16).digest()
+
+    def _shard_index(self, key: bytes) -> int:
+        """Select the shard holding a given key."""
+        return key[0] % len(self._shards)
+
+    def get(self, prompt: str, scope: str = "") -> str | None:
+        """Return the cached response for a prompt, or None if absent/expired."""
+        key = self._key(prompt, scope)
+        index = self._shard_index(key)
+        self._sketch.increment(key)
+        entry = self._shards[index].get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at >= time.monotonic():
+                return value
+            with self._locks[index]:
+                self._shards[index].pop(key, None)
+        if self._disk is not None:
+            value = self._disk.get(key.hex())
+            if value is not None:
+                # Promotion into memory goes through the same capacity and
+                # admission path as set(), so a warm disk cache cannot grow
+                # the in-memory tier past max_size.
+                if len(self) < self.max_size or self._admit(key):
+                    with self._locks[index]:
+                        self._shards[index][key] = (
+                            time.monotonic() + self.ttl,
+                            value,
+                        )
+                return value
+        return None
+
+    def set(self, prompt: str, value: str, scope: str = "") -> None:
+        """Store a response for a prompt if it passes the admission check."""
+        key = self._key(prompt, scope)
+        self._sketch.increment(key)
+        if self._disk is not None:
+            self._disk.set(key.hex(), value, expire=_DISK_TTL_SECONDS)
+        if len(self) >= self.max_size and not self._admit(key):
+            return
+        index = self._shard_index(key)
+        with self._locks[index]:
+            self._shards[index][key] = (time.monotonic() + self.ttl, value)
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        for shard, lock in zip(self._shards, self._locks, strict=True):
+            with lock:
+                shard.clear()
+        if self._disk is not None:
+            self._disk.clear()
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
+
+    def _admit(self, key: bytes) -> bool:
+        """Make room for a new key, admitting it only over a colder victim."""
+        self._purge_expired()
+        while len(self) >= self.max_size:
+            shard, lock = max(
+                zip(self._shards, self._locks, strict=True),
+                key=lambda pair: len(pair[0]),
+            )
+            with lock:
+                if not shard:
+                    continue
+                victim = next(iter(shard))
+                if self._sketch.estimate(key) < self._sketch.estimate(victim):
+                    return False
+                del shard[victim]
+        return True
+
+    def _purge_expired(self) -> None:
+        """Drop all entries whose TTL has elapsed."""
+        now = time.monotonic()
+        for shard, lock in zip(self._shards, self._locks, strict=True):
+            with lock:
+                expired = [
+                    key for key, (expires_at, _) in shard.items() if expires_at < now
+                ]
+                for key in expired:
+                    del shard[key]
+
+
+_response_cache = ResponseCache(persist=True)
+
+
+def get_cache() -> ResponseCache:
+    """Return the shared response cache, persistent across handler instances."""
+    return _response_cache
@@ -84,7 +84,9 @@ class GeminiHandler(BaseModelHandler):
                     generation_config=parameters,
                 )
                 content = response.text if hasattr(response, "text") else str(response)
-                self._logger.info(f"Response from Gemini for '{index}': {content}")
+                self._logger.debug(
+                    f"Response from Gemini for '{index}': {content[:256]}"
+                )
                 return index, content
 
         except (
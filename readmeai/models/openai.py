@@ -1,5 +1,6 @@
 """OpenAI API model handler implementation, with Ollama support."""
 
+import json
 import os
 from typing import Any
 
@@ -10,6 +11,7 @@ from readmeai.extractors.models import RepositoryContext
 from readmeai.models.base import BaseModelHandler
 from readmeai.models.enums import BaseURLs, LLMProviders
 from readmeai.models.tokens import token_handler
+from readmeai.utilities.importer import is_available
 from tenacity import (
     retry,
     retry_if_exception_type,
@@ -17,6 +19,19 @@ from tenacity import (
     wait_exponential,
 )
 
+if is_available("orjson"):
+    import orjson
+
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+else:
+    orjson = None
+
+    def _json_dumps(payload: Any) -> bytes:
+        return json.dumps(payload).encode("utf-8")
+
+    _json_loads = json.loads
+
 
 class OpenAIHandler(BaseModelHandler):
     """
@@ -38,32 +53,33 @@ class OpenAIHandler(BaseModelHandler):
 
         if self.config.llm.api == LLMProviders.OPENAI.value:
             self.url = f"{self.host_name}{self.resource}"
-            if os.getenv("OPENAI_API_KEY") is None:
+            api_key = os.getenv("OPENAI_API_KEY")
+            if api_key is None:
                 raise ValueError("OpenAI API key not set in environment.")
-            self.client = openai.OpenAI()
 
         elif self.config.llm.api == LLMProviders.OLLAMA.value:
             self.url = f"{self.localhost}{self.resource}"
-            self.client = openai.OpenAI(
-                base_url=f"{self.localhost}v1",
-                api_key=LLMProviders.OLLAMA.name,
-            )
+            api_key = LLMProviders.OLLAMA.name
 
-        self.headers = {"Authorization": f"Bearer {self.client.api_key}"}
+        self.headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+        }
+        self._system_prompt = {"role": "system", "content": self.system_message}
+        self._base_payload = {
+            "model": self.model,
+            "temperature": self.temperature,
+        }
 
     async def _build_payload(self, prompt: str) -> dict[str, Any]:
         """Build request body for making text generation requests."""
         return {
+            **self._base_payload,
             "messages": [
-                {
-                    "role": "system",
-                    "content": self.system_message,
-                },
+                self._system_prompt,
                 {"role": "user", "content": prompt},
             ],
-            "model": self.model,
             "max_tokens": self.max_tokens,
-            "temperature": self.temperature,
         }
 
     @retry(
@@ -107,17 +123,20 @@ class OpenAIHandler(BaseModelHandler):
             async with self._session.post(
                 self.url,
                 headers=self.headers,
-                json=parameters,
+                data=_json_dumps(parameters),
             ) as response:
                 response.raise_for_status()
-                response = await response.json()
+                # Read raw bytes and decode in one pass, skipping the
+                # content-type validation and charset sniffing in .json().
+                response = _json_loads(await response.read())
                 content = response["choices"][0]["message"]["content"]
 
                 if not content:
                     raise ValueError("Empty response from API")
 
-                self._logger.info(
-                    f"Response from {self.config.llm.api.capitalize()} for '{index}': {content}",
+                provider = self.config.llm.api.capitalize()
+                self._logger.debug(
+                    f"Response from {provider} for '{index}': {content[:256]}",
                 )
                 return index, content
 
@@ -38,7 +38,7 @@ async def token_handler(
         _logger.debug(
             f"Truncating '{index}' prompt: {token_count} > {max_count} tokens!",
         )
-        prompt = truncate_tokens(encoder, prompt, tokens)
+        prompt = truncate_tokens(encoder, prompt, tokens, token_count)
 
     return prompt
 
@@ -58,13 +58,19 @@ def count_tokens(text: str, encoder: str) -> int:
     return token_count
 
 
-def truncate_tokens(encoding: str, text: str, max_count: int) -> str:
+def truncate_tokens(
+    encoding: str,
+    text: str,
+    max_count: int,
+    token_count: int | None = None,
+) -> str:
     """Truncate a text string to a maximum number of tokens."""
     if not text:
         return text
     try:
-        encoder = _set_encoding_cache(encoding)
-        token_count = len(encoder.encode(text))
+        if token_count is None:
+            encoder = _set_encoding_cache(encoding)
+            token_count = len(encoder.encode(text))
         if token_count <= max_count:
             return text
         char_total = len(text)
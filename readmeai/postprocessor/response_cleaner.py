@@ -2,6 +2,34 @@
 
 import re
 
+# Patterns are compiled once at import time; the cleaning functions run for
+# every generated summary, so per-call pattern lookups add up on large repos.
+_MD_TABLE_RE = re.compile(
+    r"(?:.*\n)*(\|.*\|.*\n\|[-: ]+\|[-: ]+\|.*\n(?:\|.*\|.*\n)*)(?:.*\n)*",
+    re.DOTALL,
+)
+_TRAILING_MARKS_MULTILINE_RE = re.compile(r"\*+$", re.MULTILINE)
+_LEADING_BULLET_RE = re.compile(r"^[\s]*[-*]\s+", re.MULTILINE)
+_NESTED_EMPHASIS_RE = re.compile(
+    r"\*{1,2}(?P<content>[^*\n]+(?:\*{1,2}[^*\n]+\*{1,2}[^*\n]+)*)\*{1,2}",
+)
+_STANDALONE_MARKS_RE = re.compile(r"(?<!\*)\*(?!\*)|(?<!_)_(?!_)")
+_LEADING_LABEL_RE = re.compile(r"^[^:]*:\s*")
+_BOLD_COLON_RE = re.compile(r"\*\*:\s*", re.DOTALL)
+_UNCLOSED_QUOTE_END_RE = re.compile(r"['\"](.*?)$")
+_UNCLOSED_QUOTE_START_RE = re.compile(r"^(.*?)['\"]")
+_CODE_SUMMARY_RE = re.compile(
+    r"\*\*Code Summary:\*\*\s*(.*?)\s*provides functions to",
+    re.DOTALL,
+)
+_QUOTED_TEXT_RE = re.compile(r"(?<!\w)['\"](.*?)['\"](?!\w)")
+_LEADING_NONALPHA_RE = re.compile(r"^[^a-zA-Z]*")
+_SPACE_BEFORE_PUNCT_RE = re.compile(r"\s*([)'.!,?;:])(?!\.\s*\w)")
+_SPACE_AFTER_PAREN_RE = re.compile(r"(\()\s*")
+_MULTI_SPACE_RE = re.compile(r" +")
+_HYPHEN_SPACE_RE = re.compile(r"\s*-\s*")
+_TRAILING_MARKS_RE = re.compile(r"\*+$")
+
 
 def fix_markdown_table_rows(md_table: str) -> str:
     """Format a Markdown table with feature and description columns."""
@@ -33,29 +61,27 @@ def format_markdown_table(text: str) -> str:
     if "REPLACE-ME</code>" in text:
         return text
 
-    pattern = r"(?:.*\n)*(\|.*\|.*\n\|[-: ]+\|[-: ]+\|.*\n(?:\|.*\|.*\n)*)(?:.*\n)*"
-    match = re.search(pattern, text, re.DOTALL)
+    match = _MD_TABLE_RE.search(text)
     return match[1].strip() if match else ""
 
 
 def process_markdown(text):
     """Remove uneven Markdown syntax while preserving valid formatting."""
     # Remove extra asterisks at the end of lines
-    text = re.sub(r"\*+$", "", text, flags=re.MULTILINE)
+    text = _TRAILING_MARKS_MULTILINE_RE.sub("", text)
 
     # Remove unmatched bullets or hyphens at the beginning of lines
-    text = re.sub(r"^[\s]*[-*]\s+", "", text, flags=re.MULTILINE)
+    text = _LEADING_BULLET_RE.sub("", text)
 
     # Preserve valid bold and italic formatting
     # This regex handles nested bold and italic formatting
-    text = re.sub(
-        r"\*{1,2}(?P<content>[^*\n]+(?:\*{1,2}[^*\n]+\*{1,2}[^*\n]+)*)\*{1,2}",
+    text = _NESTED_EMPHASIS_RE.sub(
         lambda m: m.group(0) if m.group(0).count("*") % 2 == 0 else m.group(0)[1:-1],
         text,
     )
 
     # Remove standalone asterisks or underscores
-    text = re.sub(r"(?<!\*)\*(?!\*)|(?<!_)_(?!_)", "", text)
+    text = _STANDALONE_MARKS_RE.sub("", text)
 
     return text.strip()
 
@@ -63,45 +89,41 @@ def process_markdown(text):
 def process_text(text: str) -> str:
     """Format and clean generated text from the LLM."""
     # Dynamically remove all text before and including the first colon if any exist
-    text = re.sub(r"^[^:]*:\s*", "", text)
+    text = _LEADING_LABEL_RE.sub("", text)
 
     # Remove any text before and including "**:"
-    text = re.sub(r"\*\*:\s*", "", text, flags=re.DOTALL)
+    text = _BOLD_COLON_RE.sub("", text)
 
     # Remove single and double quotes that are missing their closing counterpart
-    text = re.sub(r"['\"](.*?)$", r"\1", text)
-    text = re.sub(r"^(.*?)['\"]", r"\1", text)
+    text = _UNCLOSED_QUOTE_END_RE.sub(r"\1", text)
+    text = _UNCLOSED_QUOTE_START_RE.sub(r"\1", text)
 
     # Remove specific pattern and rephrase
-    text = re.sub(
-        r"\*\*Code Summary:\*\*\s*(.*?)\s*provides functions to",
-        r"Provides functions to",
-        text,
-        flags=re.DOTALL,
-    )
+    text = _CODE_SUMMARY_RE.sub(r"Provides functions to", text)
+
     # Remove single and double quotes around any text
-    text = re.sub(r"(?<!\w)['\"](.*?)['\"](?!\w)", r"\1", text)
+    text = _QUOTED_TEXT_RE.sub(r"\1", text)
 
     # Remove newlines and tabs
     text = text.replace("\n", "").replace("\t", "")
 
     # Remove non-letter characters from the beginning of the string
-    text = re.sub(r"^[^a-zA-Z]*", "", text)
+    text = _LEADING_NONALPHA_RE.sub("", text)
 
     # Remove extra white space around punctuation except for '('
-    text = re.sub(r"\s*([)'.!,?;:])(?!\.\s*\w)", r"\1", text)
+    text = _SPACE_BEFORE_PUNCT_RE.sub(r"\1", text)
 
     # Remove extra white space before opening parentheses
-    text = re.sub(r"(\()\s*", r"\1", text)
+    text = _SPACE_AFTER_PAREN_RE.sub(r"\1", text)
 
     # Replace multiple consecutive spaces with a single space
-    text = re.sub(r" +", " ", text)
+    text = _MULTI_SPACE_RE.sub(" ", text)
 
     # Remove extra white space around hyphens
-    text = re.sub(r"\s*-\s*", "-", text)
+    text = _HYPHEN_SPACE_RE.sub("-", text)
 
     # Specifically target and remove trailing special characters like asterisks
-    text = re.sub(r"\*+$", "", text)
+    text = _TRAILING_MARKS_RE.sub("", text)
 
     text = text.strip()
 
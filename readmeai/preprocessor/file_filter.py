@@ -3,15 +3,21 @@
 from pathlib import Path
 
 
+def compile_ignore_list(ignore_list: dict) -> dict:
+    """Convert ignore list sections to frozensets for O(1) membership checks."""
+    return {section: frozenset(values) for section, values in ignore_list.items()}
+
+
 def is_excluded(ignore_list: dict, file_path: Path, repo_path: Path) -> bool:
     """Check if the file should be ignored based on the ignore list."""
     relative_path = file_path.relative_to(repo_path)
 
-    for ignored_dir in ignore_list.get("directories", []):
-        if ignored_dir in relative_path.parts:
-            return True
-
-    if file_path.suffix.lstrip(".") in ignore_list.get("extensions", []):
-        return True
+    directories = ignore_list.get("directories", ())
+    extensions = ignore_list.get("extensions", ())
+    files = ignore_list.get("files", ())
 
-    return file_path.name in ignore_list.get("files", [])
+    return (
+        any(part in directories for part in relative_path.parts)
+        or file_path.suffix.lstrip(".") in extensions
+        or file_path.name in files
+    )
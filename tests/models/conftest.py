@@ -1,5 +1,6 @@
 """Fixtures for the LLM API clients."""
 
+import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import aiohttp
@@ -32,12 +33,12 @@ def mock_aiohttp_session():
     """Fixture to provide a mocked aiohttp.ClientSession."""
     mock_session = MagicMock(spec=aiohttp.ClientSession)
     mock_response_cm = AsyncMock()
+    mock_response_body = {
+        "choices": [{"message": {"content": "test_response"}}],
+    }
     mock_response = AsyncMock(
-        json=AsyncMock(
-            return_value={
-                "choices": [{"message": {"content": "test_response"}}],
-            },
-        ),
+        json=AsyncMock(return_value=mock_response_body),
+        read=AsyncMock(return_value=json.dumps(mock_response_body).encode("utf-8")),
     )
     mock_response.raise_for_status = MagicMock()
     mock_response_cm.__aenter__.return_value = mock_response
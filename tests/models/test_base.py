@@ -0,0 +1,45 @@
+"""Tests for the base handler's batched file-summary pipeline."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+from readmeai.models.openai import OpenAIHandler
+
+
+@pytest.mark.asyncio
+async def test_code_summary_coalesces_identical_contents(
+    openai_handler: OpenAIHandler,
+):
+    """Test that byte-identical files share one request and one summary."""
+    openai_handler.cache.clear()
+    openai_handler._make_request = AsyncMock(return_value=("index", "shared_summary"))
+    repo_files = [
+        ("src/a/__init__.py", ""),
+        ("src/main.py", "def main(): ..."),
+        ("src/b/__init__.py", ""),
+    ]
+    summaries = await openai_handler._make_request_code_summary({
+        "repo_files": repo_files,
+    })
+    assert openai_handler._make_request.call_count == 2
+    assert summaries[0][1] == summaries[2][1] == "shared_summary"
+    prompts = [call.args[1] for call in openai_handler._make_request.await_args_list]
+    assert any("src/a/__init__.py, src/b/__init__.py" in prompt for prompt in prompts)
+
+
+@pytest.mark.asyncio
+async def test_code_summary_preserves_input_order(
+    openai_handler: OpenAIHandler,
+):
+    """Test that summaries are returned in the input file order."""
+    openai_handler.cache.clear()
+
+    def fake_request(index, *_args):
+        return index, f"summary for {index}"
+
+    openai_handler._make_request = AsyncMock(side_effect=fake_request)
+    repo_files = [(f"src/module_{i}.py", f"print({i})") for i in range(25)]
+    summaries = await openai_handler._make_request_code_summary({
+        "repo_files": repo_files,
+    })
+    assert summaries == [(path, f"summary for {path}") for path, _ in repo_files]
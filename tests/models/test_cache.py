@@ -0,0 +1,65 @@
+from readmeai.models.cache import ResponseCache, get_cache
+
+
+def test_get_cache_returns_shared_instance():
+    """Test that the module-level cache is a shared singleton."""
+    assert get_cache() is get_cache()
+
+
+def test_cache_get_miss_returns_none():
+    """Test that a cache miss returns None."""
+    cache = ResponseCache()
+    assert cache.get("unknown_prompt") is None
+
+
+def test_cache_set_and_get():
+    """Test that a stored response is returned on lookup."""
+    cache = ResponseCache()
+    cache.set("test_prompt", "test_response")
+    assert cache.get("test_prompt") == "test_response"
+
+
+def test_cache_expired_entry_returns_none():
+    """Test that an expired entry is treated as a miss."""
+    cache = ResponseCache(ttl=0.0)
+    cache.set("test_prompt", "test_response")
+    assert cache.get("test_prompt") is None
+
+
+def test_cache_eviction_respects_max_size():
+    """Test that insertion beyond capacity evicts the oldest entries."""
+    cache = ResponseCache(max_size=2)
+    cache.set("prompt_1", "response_1")
+    cache.set("prompt_2", "response_2")
+    cache.set("prompt_3", "response_3")
+    assert len(cache) <= 2
+    assert cache.get("prompt_3") == "response_3"
+
+
+def test_cache_scope_namespaces_keys():
+    """Test that the same prompt is cached separately per scope."""
+    cache = ResponseCache()
+    cache.set("test_prompt", "openai_response", scope="openai:gpt-3.5-turbo")
+    cache.set("test_prompt", "ollama_response", scope="ollama:llama3.1")
+    assert cache.get("test_prompt", scope="openai:gpt-3.5-turbo") == "openai_response"
+    assert cache.get("test_prompt", scope="ollama:llama3.1") == "ollama_response"
+    assert cache.get("test_prompt") is None
+
+
+def test_cache_admission_keeps_hot_entries():
+    """Test that a one-hit insert cannot displace a frequently-read entry."""
+    cache = ResponseCache(max_size=1)
+    cache.set("hot_prompt", "hot_response")
+    for _ in range(4):
+        assert cache.get("hot_prompt") == "hot_response"
+    cache.set("cold_prompt", "cold_response")
+    assert cache.get("hot_prompt") == "hot_response"
+    assert cache.get("cold_prompt") is None
+
+
+def test_cache_clear_removes_entries():
+    """Test that clear empties the cache."""
+    cache = ResponseCache()
+    cache.set("test_prompt", "test_response")
+    cache.clear()
+    assert len(cache) == 0